@@ -2,7 +2,10 @@ import os
 import sys
 import time
 import inspect
+import functools
+from itertools import chain
 from inspect import cleandoc
+from types import MappingProxyType, FunctionType
 from packaging import version
 from importlib import import_module, resources
 from typing import Optional, Union, List, Set, get_type_hints
@@ -10,9 +13,9 @@ from typing import Optional, Union, List, Set, get_type_hints
 from cobaya.log import HasLogger, LoggedError, get_logger
 from cobaya.typing import Any, InfoDict, InfoDictIn, empty_dict, validate_type
 from cobaya.tools import resolve_packages_path, load_module, get_base_classes, \
-    get_internal_class_component_name, deepcopy_where_possible, VersionCheckError
+    get_internal_class_component_name, smart_deepcopy, VersionCheckError
 from cobaya.conventions import kinds, cobaya_package, reserved_attributes
-from cobaya.yaml import yaml_load_file, yaml_dump, yaml_load
+from cobaya.yaml import yaml_load_file, yaml_dump
 from cobaya.mpi import is_main_process
 import cobaya
 
@@ -76,6 +79,38 @@ class Description:
         return return_func
 
 
+# Types of class attributes that are never options (see HasDefaults.get_class_options)
+_non_option_attribute_types = (FunctionType, classmethod, staticmethod, property)
+
+
+def _cached_on_class(method):
+    """
+    Decorator for class methods without arguments, whose result is stored in the class
+    (not shared with subclasses) after the first call.
+    """
+    attr = "_cached_" + method.__name__
+
+    @functools.wraps(method)
+    def wrapper(cls):
+        if attr not in cls.__dict__:
+            setattr(cls, attr, method(cls))
+        return cls.__dict__[attr]
+
+    return wrapper
+
+
+def _intern_keys(info):
+    """
+    Returns a copy of the nested dicts and lists in ``info`` with interned string keys.
+    """
+    if isinstance(info, dict):
+        return {(sys.intern(k) if type(k) is str else k): _intern_keys(v)
+                for k, v in info.items()}
+    if isinstance(info, list):
+        return [_intern_keys(v) for v in info]
+    return info
+
+
 class HasDefaults:
     """
     Base class for components that can read settings from a .yaml file.
@@ -85,6 +120,7 @@ class HasDefaults:
     """
 
     @classmethod
+    @_cached_on_class
     def get_qualified_names(cls) -> List[str]:
         if cls.__module__ == '__main__':
             return [cls.__name__]
@@ -107,6 +143,7 @@ class HasDefaults:
                     range(len(parts) + 1)]
 
     @classmethod
+    @_cached_on_class
     def get_qualified_class_name(cls) -> str:
         """
         Get the distinct shortest reference name for the class of the form
@@ -126,6 +163,7 @@ class HasDefaults:
             return qualified_names[0]
 
     @classmethod
+    @_cached_on_class
     def get_class_path(cls) -> str:
         """
         Get the file path for the class.
@@ -145,6 +183,7 @@ class HasDefaults:
         return os.path.join(cls.get_class_path(), cls.get_file_base_name())
 
     @classmethod
+    @_cached_on_class
     def get_yaml_file(cls) -> Optional[str]:
         """
         Gets the file name of the .yaml file for this component if it exists on file
@@ -162,21 +201,21 @@ class HasDefaults:
         return cleandoc(cls.__doc__) if cls.__doc__ else ""
 
     @classmethod
+    @_cached_on_class
     def get_bibtex(cls) -> Optional[str]:
         """
         Get the content of .bibtex file for this component. If no specific bibtex
         from this class, it will return the result from an inherited class if that
         provides bibtex.
         """
-        if filename := cls.__dict__.get('bibtex_file'):
-            bib = cls.get_text_file_content(filename)
-        else:
-            bib = cls.get_associated_file_content('.bibtex')
-        if bib:
-            return bib
-        for base in cls.__bases__:
+        for base in cls.__mro__:
             if issubclass(base, HasDefaults) and base is not HasDefaults:
-                return base.get_bibtex()
+                if filename := base.__dict__.get('bibtex_file'):
+                    bib = base.get_text_file_content(filename)
+                else:
+                    bib = base.get_associated_file_content('.bibtex')
+                if bib:
+                    return bib
         return None
 
     @classmethod
@@ -195,11 +234,14 @@ class HasDefaults:
         return cls.get_text_file_content((file_root or cls.get_file_base_name()) + ext)
 
     @classmethod
+    @functools.lru_cache(maxsize=512)
     def get_text_file_content(cls, file_name: str) -> Optional[str]:
         """
         Return the content of a file in the directory of the module, if it exists.
+
+        The content is read only once per class and file name.
         """
-        package = inspect.getmodule(cls).__package__
+        package = sys.modules[cls.__module__].__package__
         try:
             if os.path.split(str(file_name))[0]:
                 raise ValueError(f"{file_name} must be a bare file name, without path.")
@@ -227,13 +269,15 @@ class HasDefaults:
         :param input_options: optional dictionary of input parameters
         :return:  dict of names and values
         """
+        # cheap type check first, for most methods, before the slower inspect.isroutine
         return {k: v for k, v in cls.__dict__.items() if not k.startswith('_') and
-                k not in reserved_attributes and not inspect.isroutine(v) and
-                not isinstance(v, property)}
+                k not in reserved_attributes and
+                not isinstance(v, _non_option_attribute_types) and
+                not inspect.isroutine(v)}
 
     @classmethod
     def get_defaults(cls, return_yaml=False, yaml_expand_defaults=True,
-                     input_options=empty_dict):
+                     input_options=empty_dict, mutable=True):
         """
         Return defaults for this component_or_class, with syntax:
 
@@ -258,45 +302,97 @@ class HasDefaults:
         Also note that if you return a dictionary it may be modified (return a deep copy
         if you want to keep it).
 
+        If `mutable` is set to False, a read-only view of the defaults is returned,
+        whose values are not copied: faster if the defaults are only going to be read.
+        Nested values must not be modified in that case.
+
         if yaml_expand_defaults then !default: file includes will be expanded
 
         input_options may be a dictionary of input options, e.g. in case default params
         are dynamically dependent on an input variable
         """
+        # Class attributes may be reassigned at any time, so the defaults are not stored
+        # (only the parsed yaml file is)
+        # values are copied if the result may be modified (and for yaml output, to avoid
+        # aliases of shared values)
+        copy = mutable or return_yaml
+        defaults = cls._get_own_defaults(input_options=input_options, copy=copy)
+        if return_yaml:
+            if yaml_expand_defaults:
+                return yaml_dump(defaults)
+            # class attributes cannot be returned as unexpanded yaml text
+            if cls.get_class_options(input_options=input_options):
+                return ""
+            return cls.get_associated_file_content('.yaml') or ""
+        defaults = cls._get_inherited_defaults(input_options, {cls: defaults}, copy)
+        return defaults if mutable else MappingProxyType(defaults)
+
+    @classmethod
+    def _get_inherited_defaults(cls, input_options, own_defaults,
+                                copy=True) -> InfoDict:
+        """
+        Returns the defaults of the class merged with those of its bases, the latter
+        bases taking precedence over the former ones, and the class over all of them.
+
+        The own defaults of each class are stored in ``own_defaults``, so that they are
+        computed only once for common ancestors.
+        """
+        if (own := own_defaults.get(cls)) is None:
+            own = own_defaults[cls] = cls._get_own_defaults(input_options=input_options,
+                                                            copy=copy)
+        # start with this one to keep the order such that most recent class options
+        # near the top. Update below to actually override parameters with these.
+        defaults = dict.fromkeys(own)
+        for base in cls.__bases__:
+            if issubclass(base, HasDefaults) and base is not HasDefaults:
+                defaults.update(
+                    base._get_inherited_defaults(input_options, own_defaults, copy))
+        defaults.update(own)
+        return defaults
+
+    @classmethod
+    def _get_own_defaults(cls, input_options=empty_dict, copy=True) -> InfoDict:
+        """
+        Returns the defaults defined by this class alone, either in its .yaml file or
+        as class attributes, but not those inherited from its bases.
+
+        If ``copy`` is False, the values are not copied, and must not be modified.
+        """
         if 'class_options' in cls.__dict__:
             log = get_logger(cls.get_qualified_class_name())
             raise LoggedError(log, "class_options (in %s) should now be replaced by "
                                    "public attributes defined directly in the class" %
                               cls.get_qualified_class_name())
-        yaml_text = cls.get_associated_file_content('.yaml')
         options = cls.get_class_options(input_options=input_options)
-        if options and yaml_text:
-            yaml_options = yaml_load(yaml_text)
-            if both := set(yaml_options).intersection(options):
-                raise LoggedError(get_logger(cls.get_qualified_class_name()),
-                                  "%s: class has .yaml and class variables/options "
-                                  "that define the same keys: %s \n"
-                                  "(type declarations without values are fine "
-                                  "with yaml file as well).",
-                                  cls.get_qualified_class_name(), list(both))
+        if (yaml_options := cls._get_yaml_defaults()) is None:
+            return {k: smart_deepcopy(v) for k, v in options.items()} if copy \
+                else options
+        if both := set(yaml_options).intersection(options):
+            raise LoggedError(get_logger(cls.get_qualified_class_name()),
+                              "%s: class has .yaml and class variables/options "
+                              "that define the same keys: %s \n"
+                              "(type declarations without values are fine "
+                              "with yaml file as well).",
+                              cls.get_qualified_class_name(), list(both))
+        if not copy:
             options.update(yaml_options)
-            yaml_text = None
-        if return_yaml and not yaml_expand_defaults:
-            return yaml_text or ""
-        this_defaults = yaml_load_file(cls.get_yaml_file(), yaml_text) \
-            if yaml_text else deepcopy_where_possible(options)
-        # start with this one to keep the order such that most recent class options
-        # near the top. Update below to actually override parameters with these.
-        defaults = this_defaults.copy()
-        if not return_yaml:
-            for base in cls.__bases__:
-                if issubclass(base, HasDefaults) and base is not HasDefaults:
-                    defaults.update(base.get_defaults(input_options=input_options))
-        defaults.update(this_defaults)
-        if return_yaml:
-            return yaml_dump(defaults)
-        else:
-            return defaults
+            return options
+        # keys do not overlap: copy both into the result, without merging them first
+        return {k: smart_deepcopy(v)
+                for k, v in chain(options.items(), yaml_options.items())}
+
+    @classmethod
+    @_cached_on_class
+    def _get_yaml_defaults(cls) -> Optional[InfoDict]:
+        """
+        Returns the parsed content of the .yaml file of the class, if it exists.
+
+        It is parsed only once per class: make a copy before modifying it. String keys
+        are interned, since the same ones appear in the defaults of many components.
+        """
+        if yaml_text := cls.get_associated_file_content('.yaml'):
+            return _intern_keys(yaml_load_file(cls.get_yaml_file(), yaml_text) or {})
+        return None
 
     # noinspection PyUnusedLocal
     @classmethod
@@ -311,14 +407,19 @@ class HasDefaults:
 
     @classmethod
     def get_annotations(cls) -> InfoDict:
+        return dict(cls._get_annotations())
+
+    @classmethod
+    @_cached_on_class
+    def _get_annotations(cls) -> InfoDict:
+        # later bases take precedence over former ones, and the class over all of them
         d = {}
         for base in cls.__bases__:
             if issubclass(base, HasDefaults) and base is not HasDefaults:
-                d.update(base.get_annotations())
-
-            # from Python 10 should use just cls.__annotations__
-            d.update({k: v for k, v in cls.__dict__.get("__annotations__", {}).items()
-                      if not k.startswith('_')})
+                d.update(base._get_annotations())
+        # from Python 10 should use just cls.__annotations__
+        d.update({k: v for k, v in cls.__dict__.get("__annotations__", {}).items()
+                  if not k.startswith('_')})
         return d
 
 
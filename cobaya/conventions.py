@@ -25,8 +25,9 @@ kinds: Final = ("sampler", "theory", "likelihood")
 
 # Reserved attributes for component classes with defaults.
 # These are ignored by HasDefaults.get_class_options()
-reserved_attributes: Final = {"input_params", "output_params", "install_options",
-                              "bibtex_file", "file_base_name"}
+reserved_attributes: Final = frozenset({"input_params", "output_params",
+                                        "install_options", "bibtex_file",
+                                        "file_base_name"})
 
 # Conventional order for yaml dumping (purely cosmetic)
 dump_sort_cosmetic: Final = ["theory", "likelihood", "prior", "params", "sampler", "post"]
@@ -8,13 +8,11 @@
 
 # Global
 import os
-import inspect
 import platform
-from copy import deepcopy
 from itertools import chain
-from functools import reduce
-from typing import Mapping, MutableMapping, Union, Optional, TypeVar, Callable, Dict, \
-    List
+from functools import lru_cache, reduce
+from operator import getitem
+from typing import Mapping, MutableMapping, Union, Optional, TypeVar, Callable, Dict
 from collections import defaultdict
 
 # Local
@@ -23,8 +21,9 @@ from cobaya.conventions import products_path, kinds, separator_files, \
 from cobaya.typing import InputDict, InfoDict, ModelDict, ExpandedParamsDict, LikesDict, \
     empty_dict
 from cobaya.tools import recursive_update, str_to_list, get_base_classes, \
-    fuzzy_match, deepcopy_where_possible
-from cobaya.component import get_component_class, ComponentNotFoundError
+    fuzzy_match, deepcopy_where_possible, smart_deepcopy
+from cobaya.component import get_component_class, ComponentNotFoundError, \
+    CobayaComponent
 from cobaya.yaml import yaml_load_file, yaml_load
 from cobaya.log import LoggedError, get_logger
 from cobaya.parameterization import expand_info_param
@@ -34,6 +33,11 @@ import cobaya.typing
 # Logger
 logger = get_logger(__name__)
 
+_is_windows = platform.system() == "Windows"
+
+# Kinds of components that can have input/output parameters
+_theory_like_kinds = frozenset(("theory", "likelihood"))
+
 
 def load_input_dict(info_or_yaml_or_file: Union[InputDict, str, os.PathLike]
                     ) -> InputDict:
@@ -69,13 +73,8 @@ def load_input_file(input_file: Union[str, os.PathLike],
             info["output"] = root
     else:
         # Passed an existing output_prefix?
-        # First see if there is a binary info pickle
-        updated_file = get_info_path(*split_prefix(input_file), ext=Extension.dill)
-        if not os.path.exists(updated_file):
-            # Try to find the corresponding *.updated.yaml
-            updated_file = get_info_path(*split_prefix(input_file))
         try:
-            info = load_input_MPI(updated_file)
+            info = load_updated_info_MPI(input_file)
         except IOError:
             err_msg = "Not a valid input file, or non-existent run to resume."
             if help_commands:
@@ -97,10 +96,8 @@ def load_input(input_file: str) -> InputDict:
     file_name, extension = os.path.splitext(input_file)
     file_name = os.path.basename(file_name)
     info: InputDict
-    if extension.lower() in Extension.yamls:
-        info = yaml_load_file(input_file) or {}  # type: ignore
-    elif extension == Extension.dill:
-        info = load_info_dump(input_file) or {}
+    if extension.lower() in Extension.yamls or extension == Extension.dill:
+        info = _load_info_file(input_file) or {}
     else:
         raise LoggedError(
             logger, "Extension of input file '%s' not recognized.", input_file)
@@ -126,6 +123,17 @@ def load_input_MPI(input_file) -> InputDict:
     return load_input(input_file)
 
 
+# the updated info file is found and loaded by the root process only, and then shared
+@mpi.from_root
+def load_updated_info_MPI(output_prefix) -> InputDict:
+    # First see if there is a binary info pickle
+    updated_file = get_info_path(*split_prefix(output_prefix), ext=Extension.dill)
+    if not os.path.exists(updated_file):
+        # Try to find the corresponding *.updated.yaml
+        updated_file = get_info_path(*split_prefix(output_prefix))
+    return load_input(updated_file)
+
+
 def load_info_overrides(*infos_or_yaml_or_files, **flags) -> InputDict:
     """
     Takes a number of input dictionaries (or paths to them), loads them and updates them,
@@ -149,9 +157,30 @@ def load_info_overrides(*infos_or_yaml_or_files, **flags) -> InputDict:
 
 # load from dill pickle, including any lambda functions or external classes
 def load_info_dump(input_file) -> InputDict:
-    import dill
-    with open(input_file, 'rb') as f:
-        return dill.load(f)
+    return _load_info_file(input_file)
+
+
+def _load_info_file(input_file) -> InputDict:
+    """
+    Loads a yaml or dill info file, re-using the result of previous loads of the same
+    file if it has not been modified since (checked by modification time and size).
+
+    Returns a copy, so that the cached info is not modified by the caller.
+    """
+    file_stat = os.stat(input_file)
+    return deepcopy_where_possible(_load_info_file_cached(
+        os.path.abspath(input_file), file_stat.st_mtime_ns, file_stat.st_size))
+
+
+# NB: files included with !defaults are not checked for modifications
+# noinspection PyUnusedLocal
+@lru_cache(maxsize=64)
+def _load_info_file_cached(input_file: str, mtime_ns: int, size: int) -> InputDict:
+    if os.path.splitext(input_file)[1] == Extension.dill:
+        import dill
+        with open(input_file, 'rb') as f:
+            return dill.load(f)
+    return yaml_load_file(input_file)
 
 
 def split_prefix(prefix):
@@ -160,7 +189,7 @@ def split_prefix(prefix):
 
     If on Windows, allows for unix-like input.
     """
-    if platform.system() == "Windows":
+    if _is_windows:
         prefix = prefix.replace("/", os.sep)
     folder = os.path.dirname(prefix) or "."
     file_prefix = os.path.basename(prefix)
@@ -169,6 +198,9 @@ def split_prefix(prefix):
     return folder, file_prefix
 
 
+_info_file_suffixes = {"input": FileSuffix.input, "updated": FileSuffix.updated}
+
+
 def get_info_path(folder, prefix, infix=None, kind="updated", ext=Extension.yamls[0]):
     """
     Gets path to info files saved by Output.
@@ -177,13 +209,13 @@ def get_info_path(folder, prefix, infix=None, kind="updated", ext=Extension.yaml
         infix = ""
     elif not infix.endswith("."):
         infix += "."
-    info_file_prefix = os.path.join(
-        folder, prefix + (separator_files if prefix else ""))
     try:
-        suffix = {"input": FileSuffix.input, "updated": FileSuffix.updated}[kind.lower()]
+        suffix = _info_file_suffixes[kind.lower()]
     except KeyError:
         raise ValueError("`kind` must be `input|updated`")
-    return info_file_prefix + infix + suffix + ext
+    if prefix:
+        prefix += separator_files
+    return os.path.join(folder, f"{prefix}{infix}{suffix}{ext}")
 
 
 def get_used_components(*infos, return_infos=False):
@@ -203,18 +235,18 @@ def get_used_components(*infos, return_infos=False):
     the original class' name.
     """
     # TODO: take inheritance into account
-    comps: Dict[Union[str, None], List[str]] = defaultdict(list)
+    # dicts with None values used as ordered sets
+    comps: Dict[Union[str, None], Dict[str, None]] = defaultdict(dict)
     comp_infos: Dict[str, dict] = defaultdict(dict)
     for info in infos:
-        if isinstance(info, str) and info not in comps[None]:
-            comps[None] += [info]
+        if isinstance(info, str):
+            comps[None][info] = None
             if return_infos and info not in comp_infos:
                 comp_infos[info] = {}
             continue
         for kind in kinds:
             try:
-                comps[kind] += [a for a in (info.get(kind) or [])
-                                if a not in comps[kind]]
+                comps[kind].update(dict.fromkeys(info.get(kind) or ()))
             except TypeError:
                 raise LoggedError(
                     logger, ("Your input info is not well formatted at the '%s' block. "
@@ -225,10 +257,30 @@ def get_used_components(*infos, return_infos=False):
                     comp_infos[c].update((info[kind][c] or {}) if
                                          isinstance(info[kind], Mapping) else {})
     # return dictionary of non-empty blocks
-    components = {k: v for k, v in comps.items() if v}
+    components = {k: list(v) for k, v in comps.items() if v}
     return (components, dict(comp_infos)) if return_infos else components
 
 
+def get_resolved_class(component_or_class, kind=None, component_path=None,
+                       class_name=None):
+    """
+    Returns the class of a component, given by name (or class), as
+    :func:`component.get_component_class` does.
+
+    Successful lookups by name are cached, since they are repeated for the same
+    components at different stages of input processing.
+    """
+    if not isinstance(component_or_class, str):
+        return component_or_class
+    return _get_component_class_cached(component_or_class, kind, component_path,
+                                       class_name)
+
+
+@lru_cache(maxsize=256)
+def _get_component_class_cached(name, kind, component_path, class_name):
+    return get_component_class(name, kind, component_path, class_name, logger=logger)
+
+
 def get_default_info(component_or_class, kind=None, return_yaml=False,
                      yaml_expand_defaults=True, component_path=None,
                      input_options=empty_dict, class_name=None,
@@ -237,8 +289,7 @@ def get_default_info(component_or_class, kind=None, return_yaml=False,
     Get default info for a component_or_class.
     """
     try:
-        cls = get_component_class(component_or_class, kind, component_path, class_name,
-                                  logger=logger)
+        cls = get_resolved_class(component_or_class, kind, component_path, class_name)
         default_component_info = \
             cls.get_defaults(return_yaml=return_yaml,
                              yaml_expand_defaults=yaml_expand_defaults,
@@ -260,6 +311,42 @@ def get_default_info(component_or_class, kind=None, return_yaml=False,
         return default_component_info
 
 
+def _structural_copy(info):
+    """
+    Copies the nested structure of dictionaries, lists, tuples and sets of an info,
+    sharing the rest of the objects (parameter values, functions, classes...), which are
+    not modified during input processing.
+
+    As :func:`tools.deepcopy_where_possible`, converts all Mapping objects into dict.
+    """
+    if isinstance(info, Mapping):
+        return {k: _structural_copy(v) for k, v in info.items()}
+    if type(info) in (list, tuple, set):
+        return type(info)(_structural_copy(v) for v in info)
+    return info
+
+
+def _shallow_block_copy(block):
+    """
+    Copies a block of an info and its first-level dictionaries (e.g. the info of each
+    component or parameter), converting Mapping objects into dict.
+    """
+    if not isinstance(block, Mapping):
+        return block
+    return {k: dict(v) if isinstance(v, Mapping) else v for k, v in block.items()}
+
+
+def _surely_equal(value1, value2) -> bool:
+    """
+    Returns True if the values compare as equal, and False if they are different or
+    cannot be compared as a whole (e.g. if they are or contain numpy arrays).
+    """
+    try:
+        return bool(value1 == value2)
+    except (ValueError, TypeError):
+        return False
+
+
 def add_aggregated_chi2_params(param_info, all_types):
     for t in sorted(all_types):
         param_info[get_chi2_name(t)] = {"latex": get_chi2_label(t), "derived": True}
@@ -267,20 +354,29 @@ def add_aggregated_chi2_params(param_info, all_types):
 
 _Dict = TypeVar('_Dict', InputDict, ModelDict)
 
+# Reserved component options, not necessarily already in default info
+_reserved_component_options = frozenset({
+    "external", "class", "provides", "requires", "renames", "input_params",
+    "output_params", "python_path", "aliases", "package_install"})
+
 
 def update_info(info: _Dict, strict: bool = True, add_aggr_chi2: bool = True) -> _Dict:
     """
     Creates an updated info starting from the defaults for each component and updating it
     with the input info.
+
+    The input info is not modified, but the result may share with it the objects that
+    are not dicts, lists, tuples or sets (e.g. numpy arrays or class instances): copy
+    them before modifying them in place.
     """
     component_base_classes = get_base_classes()
     # Don't modify the original input, and convert all Mapping to consistent dict
-    input_info = deepcopy_where_possible(info)
+    # (only the containers are copied: other leaves are shared with the input)
+    input_info = _structural_copy(info)
     # Creates an equivalent info using only the defaults
     updated_info: _Dict = {}
     default_params_info = {}
     default_prior_info = {}
-    from cobaya.component import CobayaComponent
     for block, block_info in get_used_components(input_info).items():
         updated: InfoDict = {}
         updated_info[block] = updated
@@ -313,7 +409,7 @@ def update_info(info: _Dict, strict: bool = True, add_aggr_chi2: bool = True) ->
                                          return_undefined_annotations=True)
                 else:
                     default_class_info = deepcopy_where_possible(
-                        component_base_classes[block].get_defaults())
+                        component_base_classes[block].get_defaults(mutable=False))
             else:
                 component_path = input_block[name].get("python_path")
                 try:
@@ -328,13 +424,9 @@ def update_info(info: _Dict, strict: bool = True, add_aggr_chi2: bool = True) ->
             updated[name] = default_class_info or {}
             # Update default options with input info
             # Consistency is checked only up to first level! (i.e. subkeys may not match)
-            # Reserved attributes not necessarily already in default info:
-            reserved = {"external", "class", "provides", "requires", "renames",
-                        "input_params", "output_params", "python_path", "aliases",
-                        "package_install"}
-
-            if options_not_recognized := set(input_block[name]).difference(
-                    chain(reserved, updated[name], annotations)):
+            if options_not_recognized := (input_block[name].keys() -
+                                          _reserved_component_options -
+                                          updated[name].keys() - annotations.keys()):
                 alternatives = {}
                 available = {"external", "class", "requires", "renames"}.union(
                     updated_info[block][name])
@@ -370,10 +462,10 @@ def update_info(info: _Dict, strict: bool = True, add_aggr_chi2: bool = True) ->
     updated_info["params"] = param_info  # type: ignore
     # Add aggregated chi2 params
     if info.get("likelihood") and add_aggr_chi2:
-        all_types = set(chain(
-            *[str_to_list(like_info.get("type", []) or [])
-              for like_info in updated_info["likelihood"].values() if
-              like_info is not None]))
+        all_types = set()
+        for like_info in updated_info["likelihood"].values():
+            if like_info and (like_type := like_info.get("type")):
+                all_types.update(str_to_list(like_type))
         add_aggregated_chi2_params(param_info, all_types)
     # Add automatically-defined parameters
     if "auto_params" in updated_info:
@@ -387,15 +479,14 @@ def update_info(info: _Dict, strict: bool = True, add_aggr_chi2: bool = True) ->
                         raise LoggedError(
                             logger, ("'renames' should be a dictionary of name mappings "
                                      "(or you meant to use 'aliases')"))
-                    renames_flat = [set([k] + str_to_list(v)) for k, v in renames.items()]
+                    # Invert the renames: name -> all names equivalent to it
+                    renames_groups: Dict[str, set] = {}
+                    for k, v in renames.items():
+                        group = set([k] + str_to_list(v))
+                        for n in group:
+                            renames_groups.setdefault(n, set()).update(group)
                     for p in param_info:
-                        # Probably could be made faster by inverting
-                        # the renames dicts *once*
-                        renames_pairs = [a for a in renames_flat if p in a]
-                        if renames_pairs:
-                            this_renames = reduce(
-                                lambda x, y: x.union(y),
-                                [a for a in renames_flat if p in a])
+                        if this_renames := renames_groups.get(p):
                             param_info[p]["renames"] = \
                                 list(set(chain(this_renames, str_to_list(
                                     param_info[p].get("renames", [])))).difference({p}))
@@ -428,6 +519,12 @@ def merge_default_params_info(defaults: LikesDict):
     return defaults_merged
 
 
+# Fields of a parameter info that are removed when updating it with another field
+_params_incompatibilities = {"prior": ["value", "derived", "min", "max"],
+                             "value": ["prior", "ref", "proposal"],
+                             "derived": ["prior", "drop", "ref", "proposal"]}
+
+
 def merge_params_info(params_infos, default_derived=True):
     """
     Merges parameter infos, starting from the first one
@@ -437,54 +534,64 @@ def merge_params_info(params_infos, default_derived=True):
     (but not if one of min/max is re-defined: in that case,
     to avoid surprises, the other one is set to None=+/-inf)
     """
-    current_info = {p: expand_info_param(v, default_derived) for p, v in
-                    params_infos[0].items() or {}}
+    # Rightmost info takes precedence *also* in the sorting: set the order first
+    # (dict.fromkeys keeps the first occurrence), and fill in the infos below
+    current_info = dict.fromkeys(chain(*params_infos[::-1]))
+    for p, v in params_infos[0].items():
+        current_info[p] = expand_info_param(v, default_derived)
     for new_info in params_infos[1:]:
         if not new_info:
             continue
         for p, new_info_p in new_info.items():
-            if p not in current_info:
+            if current_info[p] is None:
                 current_info[p] = {}
+            # (expand_info_param returns a copy, so no need to copy it again)
             new_info_p = expand_info_param(new_info_p)
-            current_info[p].update(deepcopy(new_info_p))
+            current_info[p].update(new_info_p)
             # Account for incompatibilities: "prior" and ("value" or "derived"+bounds)
-            incompatibilities = {"prior": ["value", "derived", "min", "max"],
-                                 "value": ["prior", "ref", "proposal"],
-                                 "derived": ["prior", "drop", "ref", "proposal"]}
-            for f1, incomp in incompatibilities.items():
+            for f1, incomp in _params_incompatibilities.items():
                 if f1 in new_info_p:
                     for f2 in incomp:
                         current_info[p].pop(f2, None)  # type: ignore
-    # Re-sort, so that rightmost info takes precedence *also* in the sorting
-    new_order_sorted = chain(*params_infos[::-1])
-    # The following removes duplicates maintaining order (keeps the first occurrence)
-    new_order = dict.fromkeys(new_order_sorted)
-    current_info = {p: current_info[p] for p in new_order}
     return current_info
 
 
 def merge_info(*infos):
     """
     Merges information dictionaries. Rightmost arguments take precedence.
+
+    The arguments are not modified, but the result may share with them the objects that
+    are not dicts, lists, tuples or sets (also if a single info is passed).
     """
     assert len(infos)
-    previous_info = deepcopy(infos[0])
+    previous_info = _structural_copy(infos[0])
     if len(infos) == 1:
         return previous_info
     current_info = None
     for new_info in infos[1:]:
         if isinstance(previous_info, str):
             raise LoggedError(logger, previous_info)
-        previous_params_info = deepcopy(previous_info.pop("params", {}) or {})
-        new_params_info = deepcopy(new_info).pop("params", {}) or {}
-        # NS: params have been popped, since they have their own merge function
-        current_info = recursive_update(previous_info, new_info)
+        # (params infos are copied when expanded by merge_params_info)
+        previous_params_info = previous_info.pop("params", {}) or {}
+        new_params_info = new_info.get("params", {}) or {}
+        # NS: params have been left out, since they have their own merge function,
+        # but a placeholder keeps the position of the block as in a plain update
+        # (previous_info is already a copy, so it can be updated in place)
+        current_info = recursive_update(
+            previous_info,
+            {k: (None if k == "params" else v) for k, v in new_info.items()},
+            copied=False)
         current_info["params"] = merge_params_info(
             [previous_params_info, new_params_info])
         previous_info = current_info
     return current_info
 
 
+# Root-level options ignored by is_equal_info if not strict
+_ignorable_non_strict = frozenset({"debug", "resume", "force", packages_path_input,
+                                   "test", "version", "stop_at_error"})
+
+
 def is_equal_info(info_old, info_new, strict=True, print_not_log=False, ignore_blocks=()):
     """
     Compares two information dictionaries, and old one versus a new one, and updates the
@@ -501,11 +608,10 @@ def is_equal_info(info_old, info_new, strict=True, print_not_log=False, ignore_b
     else:
         myprint = logger.info
         myprint_debug = logger.debug
-    myname = inspect.stack()[0][3]
-    ignorable = {"debug", "resume", "force", packages_path_input,
-                 "test", "version", "stop_at_error"}
-    ignore = set() if strict else ignorable
-    ignore = ignore.union(ignore_blocks or [])
+    myname = is_equal_info.__name__
+    ignore = frozenset() if strict else _ignorable_non_strict
+    if ignore_blocks:
+        ignore = ignore.union(ignore_blocks)
     if set(info for info in info_old if info_old[info] is not None) - ignore \
             != set(info for info in info_new if info_new[info] is not None) - ignore:
         myprint(myname + ": different blocks or options: %r (old) vs %r (new)" % (
@@ -514,8 +620,13 @@ def is_equal_info(info_old, info_new, strict=True, print_not_log=False, ignore_b
     for block_name in info_old:
         if block_name in ignore or block_name not in info_new:
             continue
-        block1 = deepcopy_where_possible(info_old[block_name])
-        block2 = deepcopy_where_possible(info_new[block_name])
+        # Nothing to check if equal (if strict, also in the order of their keys)
+        if _surely_equal(info_old[block_name], info_new[block_name]) and \
+                (not strict or not isinstance(info_old[block_name], Mapping) or
+                 list(info_old[block_name]) == list(info_new[block_name])):
+            continue
+        block1 = _shallow_block_copy(info_old[block_name])
+        block2 = _shallow_block_copy(info_new[block_name])
         # First, deal with root-level options (force, output, ...)
         if not isinstance(block1, dict):
             if block1 != block2:
@@ -533,14 +644,16 @@ def is_equal_info(info_old, info_new, strict=True, print_not_log=False, ignore_b
         # 2. Gather general options to be ignored
         ignore_k = set()
         if not strict:
-            if block_name in ["theory", "likelihood"]:
+            if block_name in _theory_like_kinds:
                 ignore_k.update({"input_params", "output_params"})
             elif block_name == "params":
+                ignore_k.update({"latex", "renames", "ref", "proposal", "min", "max"})
                 for param in block1:
+                    if _surely_equal(block1[param], block2[param]):
+                        continue
                     # Unify notation
                     block1[param] = expand_info_param(block1[param])
                     block2[param] = expand_info_param(block2[param])
-                    ignore_k.update({"latex", "renames", "ref", "proposal", "min", "max"})
                     # Fixed params, it doesn't matter if they are saved as derived
                     if "value" in block1[param]:
                         block1[param].pop("derived", None)
@@ -559,9 +672,9 @@ def is_equal_info(info_old, info_new, strict=True, print_not_log=False, ignore_b
                         try:
                             component_path = block1[k].pop("python_path", None) \
                                 if isinstance(block1[k], dict) else None
-                            cls = get_component_class(
+                            cls = get_resolved_class(
                                 k, kind=block_name, component_path=component_path,
-                                class_name=(block1[k] or {}).get("class"), logger=logger)
+                                class_name=(block1[k] or {}).get("class"))
                             ignore_k_this.update(set(
                                 getattr(cls, "_at_resume_prefer_new", [])))
                         except ImportError:
@@ -580,10 +693,12 @@ def is_equal_info(info_old, info_new, strict=True, print_not_log=False, ignore_b
                                 value[kk] = None
             if block1[k] != block2[k]:
                 # For clarity, pop common stuff before printing
-                to_pop = [j for j in block1[k] if block1[k].get(j) == block2[k].get(j)]
-                for j in to_pop:
-                    block1[k].pop(j, None)
-                    block2[k].pop(j, None)
+                if isinstance(block1[k], dict) and isinstance(block2[k], dict):
+                    to_pop = [j for j in block1[k]
+                              if block1[k].get(j) == block2[k].get(j)]
+                    for j in to_pop:
+                        block1[k].pop(j, None)
+                        block2[k].pop(j, None)
                 myprint(
                     myname + ": different content of [%s:%s]" % (block_name, k) +
                     " -- (re-run with `debug: True` for more info)")
@@ -604,9 +719,9 @@ def get_preferred_old_values(info_old):
             try:
                 component_path = block[k].pop("python_path", None) \
                     if isinstance(block[k], dict) else None
-                cls = get_component_class(
+                cls = get_resolved_class(
                     k, kind=block_name, component_path=component_path,
-                    class_name=(block[k] or {}).get("class"), logger=logger)
+                    class_name=(block[k] or {}).get("class"))
                 prefer_old_k_this = getattr(cls, "_at_resume_prefer_old", [])
                 if prefer_old_k_this:
                     if block_name not in keep_old:
@@ -619,20 +734,28 @@ def get_preferred_old_values(info_old):
 
 
 def make_auto_params(auto_params, params_info):
-    def replace(item, tag):
-        if isinstance(item, dict):
-            for key, val in list(item.items()):
-                item[key] = replace(val, tag)
-        elif isinstance(item, str) and '%s' in item:
-            item = item % tag
-        return item
-
+    def placeholder_leaves(template):
+        # paths of keys to the strings with placeholders, walking nested dicts once
+        leaves = []
+        stack = [((), template)]
+        while stack:
+            path, d = stack.pop()
+            for key, val in d.items():
+                if type(val) is dict:
+                    stack.append((path + (key,), val))
+                elif type(val) is str and '%s' in val:
+                    leaves.append((path + (key,), val))
+        return leaves
+
+    if any('%s' not in k for k in auto_params):
+        raise LoggedError(
+            logger, "auto_param parameter names must have '%s' placeholder")
     for k, v in auto_params.items():
-        if '%s' not in k:
-            raise LoggedError(
-                logger, "auto_param parameter names must have '%s' placeholder")
         replacements = v.pop('auto_range')
         if isinstance(replacements, str):
             replacements = eval(replacements)
+        leaves = placeholder_leaves(v)
         for value in replacements:
-            params_info[k % value] = replace(deepcopy_where_possible(v), value)
+            params_info[k % value] = info = smart_deepcopy(v)
+            for path, fmt in leaves:
+                reduce(getitem, path[:-1], info)[path[-1]] = fmt % value
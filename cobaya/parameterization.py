@@ -10,6 +10,7 @@
 import numpy as np
 from numbers import Real
 from itertools import chain
+from functools import lru_cache
 from copy import deepcopy
 from typing import Mapping, Sequence, Dict, Set, List, Tuple, Any, Callable, Union
 
@@ -47,6 +48,57 @@ def expand_info_param(info_param: ParamInput, default_derived=True) -> ParamDict
     Expands the info of a parameter, from the user-friendly, shorter format
     to a more unambiguous one.
     """
+    # Most parameter infos contain only numbers and strings: cache their expansion
+    if (frozen := _freeze_info_param(info_param)) is not None:
+        return _thaw_info_param(_expand_frozen_info_param(frozen, default_derived))
+    return _expand_info_param(info_param, default_derived)
+
+
+_freezable_scalar_types = (str, int, float, bool, type(None))
+
+
+def _freeze_info_param(info):
+    """
+    Returns a hashable representation of a parameter info made only of dicts, lists,
+    tuples and scalars (strings, numbers, None), or None if there are other objects.
+
+    Types are kept, so that e.g. ``1`` and ``1.0`` have different representations.
+    """
+    info_type = type(info)
+    if info_type in _freezable_scalar_types:
+        return info_type, info
+    if info_type is dict:
+        items = tuple((k, _freeze_info_param(v)) for k, v in info.items())
+        if any(v is None for _, v in items):
+            return None
+        return dict, items
+    if info_type in (list, tuple):
+        values = tuple(_freeze_info_param(v) for v in info)
+        if any(v is None for v in values):
+            return None
+        return info_type, values
+    return None
+
+
+def _thaw_info_param(frozen):
+    """
+    Reconstructs a parameter info from the result of :func:`_freeze_info_param`.
+    """
+    info_type, content = frozen
+    if info_type is dict:
+        return {k: _thaw_info_param(v) for k, v in content}
+    if info_type in (list, tuple):
+        return info_type(_thaw_info_param(v) for v in content)
+    return content
+
+
+@lru_cache(maxsize=1024)
+def _expand_frozen_info_param(frozen, default_derived):
+    return _freeze_info_param(_expand_info_param(_thaw_info_param(frozen),
+                                                 default_derived))
+
+
+def _expand_info_param(info_param: ParamInput, default_derived=True) -> ParamDict:
     info_param = deepcopy_where_possible(info_param)
     if not isinstance(info_param, Mapping):
         if info_param is None:
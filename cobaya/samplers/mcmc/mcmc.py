@@ -1009,7 +1009,8 @@ class MCMC(CovmatSampler):
             # Unknown case (no info passed)
             string = " [(if drag: True)%s]" % drag_string
         else:
-            string = drag_string if info.get("drag", cls.get_defaults()["drag"]) else ""
+            drag = info.get("drag", cls.get_defaults(mutable=False)["drag"])
+            string = drag_string if drag else ""
         return ("Adaptive, speed-hierarchy-aware MCMC sampler (adapted from CosmoMC) "
                 r"\cite{Lewis:2002ah,Lewis:2013hha}" + string + ".")
 
@@ -532,7 +532,7 @@ class Minimize(Minimizer, CovmatSampler):
         if info is None:
             method = None
         else:
-            method = info.get("method", cls.get_defaults()["method"])
+            method = info.get("method", cls.get_defaults(mutable=False)["method"])
         desc_bobyqa = (r"Py-BOBYQA implementation "
                        r"\cite{2018arXiv180400154C,2018arXiv181211343C} of the BOBYQA "
                        r"minimization algorithm \cite{BOBYQA}")
@@ -812,7 +812,7 @@ def deepcopy_where_possible(base: _R) -> _R:
     if isinstance(base, Mapping):
         _copy = {}
         for key, value in base.items():
-            _copy[key] = deepcopy_where_possible(value)
+            _copy[key] = smart_deepcopy(value)
         return _copy  # type: ignore
     if isinstance(base, (HasLogger, type)):
         return base  # type: ignore
@@ -826,6 +826,24 @@ def deepcopy_where_possible(base: _R) -> _R:
             return base
 
 
+_immutable_atomic_types = frozenset({int, float, complex, bool, str, bytes, type(None)})
+_empty_copyable_types = frozenset({list, dict, set, tuple})
+
+
+def smart_deepcopy(obj: _R) -> _R:
+    """
+    Same as :func:`~tools.deepcopy_where_possible`, but faster for the most common
+    simple values: immutable scalars are returned as they are, and empty built-in
+    containers as new empty ones, without going through ``copy.deepcopy``.
+    """
+    obj_type = type(obj)
+    if obj_type in _immutable_atomic_types:
+        return obj
+    if obj_type in _empty_copyable_types and not obj:
+        return obj_type()
+    return deepcopy_where_possible(obj)
+
+
 def get_class_methods(cls, not_base=None, start='get_', excludes=(), first='self'):
     methods = {}
     for k, v in inspect.getmembers(cls):
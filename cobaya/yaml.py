@@ -41,7 +41,8 @@ class OutputError(Exception):
 
 # Custom loader ##########################################################################
 
-class ScientificLoader(yaml.Loader):
+# Use the faster libyaml-based loader, if available
+class ScientificLoader(getattr(yaml, "CLoader", yaml.Loader)):  # type: ignore
     pass
 
 
@@ -4,19 +4,26 @@
 from copy import deepcopy
 import pytest
 import os
+import numpy as np
 
 # Local
 from cobaya.typing import InputDict
 from cobaya.run import run, run_script
 from cobaya.log import LoggedError
-from cobaya.input import get_default_info
+from cobaya.input import get_default_info, load_input, is_equal_info, make_auto_params, \
+    merge_info
 from cobaya.yaml import yaml_dump_file, yaml_load_file
 
 # Aux definitions and functions
 
-test_info_common: InputDict = {
-    "likelihood": {"_test": None},
-    "sampler": {"evaluate": None}}
+
+def _fresh_test_info() -> InputDict:
+    # new nested dicts every time, so that tests can modify them
+    return {"likelihood": {"_test": None},
+            "sampler": {"evaluate": None}}
+
+
+test_info_common: InputDict = _fresh_test_info()
 
 
 def test_prior_inherit_nonegiven():
@@ -27,7 +34,7 @@ def test_prior_inherit_nonegiven():
 
 
 def test_prior_inherit_differentgiven():
-    test_info = deepcopy(test_info_common)
+    test_info = _fresh_test_info()
     test_info["prior"] = {"third": "lambda a1: 1"}
     updated_info, _ = run(test_info)
     likname = list(test_info_common["likelihood"])[0]
@@ -37,33 +44,33 @@ def test_prior_inherit_differentgiven():
 
 
 def test_prior_inherit_samegiven():
-    test_info = deepcopy(test_info_common)
+    test_info = _fresh_test_info()
     likname = list(test_info_common["likelihood"])[0]
     default_info = get_default_info(likname, "likelihood")
-    name, prior = deepcopy(default_info["prior"]).popitem()
-    test_info["prior"] = {name: prior}
+    name = next(iter(default_info["prior"]))
+    test_info["prior"] = {name: default_info["prior"][name]}
     updated_info, _ = run(test_info)
     assert updated_info["prior"] == default_info["prior"]
 
 
 def test_prior_inherit_samegiven_differentdefinition():
-    test_info = deepcopy(test_info_common)
+    test_info = _fresh_test_info()
     likname = list(test_info_common["likelihood"])[0]
     default_info = get_default_info(likname, "likelihood")
-    name, prior = deepcopy(default_info["prior"]).popitem()
+    name = next(iter(default_info["prior"]))
     test_info["prior"] = {name: "this is not a prior"}
     with pytest.raises(LoggedError):
         run(test_info)
 
 
 def test_inherit_label_and_bounds():
-    test_info = deepcopy(test_info_common)
+    test_info = _fresh_test_info()
     likname = list(test_info_common["likelihood"])[0]
     default_info_params = get_default_info(likname, "likelihood")["params"]
     test_info["params"] = deepcopy(default_info_params)
     test_info["params"]["a1"].pop("latex", None)
     # Remove limits, so they are inherited
-    test_info = deepcopy(test_info_common)
+    test_info = _fresh_test_info()
     test_info["params"] = deepcopy(default_info_params)
     test_info["params"]["b1"].pop("min")
     test_info["params"]["b1"].pop("max")
@@ -82,3 +89,116 @@ def test_run_file(tmpdir):
     updated_info = yaml_load_file(root + '.updated.yaml')
     assert updated_info["prior"] == default_info["prior"]
     run_script([input_file, '--resume', '--allow-changes', '--debug'])
+
+
+def test_load_input_modified_file(tmpdir):
+    input_file = os.path.join(tmpdir, 'pars.yaml')
+    yaml_dump_file(input_file, dict(test_info_common, output="first"))
+    info = load_input(input_file)
+    assert info["output"] == "first"
+    # modifying the returned info should not affect later loads
+    info["likelihood"]["other"] = None
+    assert list(load_input(input_file)["likelihood"]) == ["_test"]
+    yaml_dump_file(input_file, dict(test_info_common, output="second_output"),
+                   error_if_exists=False)
+    assert load_input(input_file)["output"] == "second_output"
+
+
+def test_is_equal_info():
+    info = {"likelihood": {"_test": {}, "gaussian_mixture": {"stop_at_error": True}},
+            "params": {"a": [0, 1], "b": {"prior": [0, 1], "latex": "b"}}}
+    assert is_equal_info(info, deepcopy(info))
+    reordered = deepcopy(info)
+    reordered["likelihood"] = {"gaussian_mixture": {"stop_at_error": True}, "_test": {}}
+    assert not is_equal_info(info, reordered)
+    assert is_equal_info(info, reordered, strict=False)
+    expanded = deepcopy(info)
+    expanded["params"]["a"] = {"prior": [0, 1]}
+    assert not is_equal_info(info, expanded)
+    assert is_equal_info(info, expanded, strict=False)
+    changed = deepcopy(info)
+    changed["params"]["b"]["prior"] = [0, 2]
+    assert not is_equal_info(info, changed, strict=False)
+    # values that cannot be compared as a whole, ignored if non-strict
+    old = {"sampler": {"mcmc": {"covmat": [[1, 0], [0, 1]]}}}
+    new = {"sampler": {"mcmc": {"covmat": np.eye(2)}}}
+    assert is_equal_info(old, new, strict=False)
+
+
+def test_default_info_not_shared():
+    likname = list(test_info_common["likelihood"])[0]
+    default_info = get_default_info(likname, "likelihood")
+    default_info["params"]["a1"]["latex"] = "modified"
+    default_info["prior"].clear()
+    default_info_again = get_default_info(likname, "likelihood")
+    assert default_info_again["params"]["a1"]["latex"] != "modified"
+    assert default_info_again["prior"]
+
+
+def test_read_only_defaults():
+    from cobaya.likelihoods._test import _test
+    defaults = _test.get_defaults(mutable=False)
+    assert dict(defaults) == _test.get_defaults()
+    with pytest.raises(TypeError):
+        defaults["prior"] = None
+
+
+def test_make_auto_params():
+    params_info = {}
+    make_auto_params({"a_%s": {"prior": {"min": 0, "max": "%s"}, "latex": "a_{%s}",
+                               "ref": {"dist": "norm", "loc": 0, "scale": 1},
+                               "auto_range": "range(1, 3)"}}, params_info)
+    assert list(params_info) == ["a_1", "a_2"]
+    assert params_info["a_2"] == {"prior": {"min": 0, "max": "2"}, "latex": "a_{2}",
+                                  "ref": {"dist": "norm", "loc": 0, "scale": 1}}
+    assert params_info["a_1"]["ref"] is not params_info["a_2"]["ref"]
+    with pytest.raises(LoggedError):
+        make_auto_params({"a": {"auto_range": [1]}}, {})
+
+
+def test_inherited_defaults_precedence():
+    from cobaya.likelihood import Likelihood
+
+    class A(Likelihood):
+        x: float = 1.
+        y: float = 1.
+
+    class B(Likelihood):
+        x: int = 2
+        z: float = 2.
+
+    class C(A, B):
+        y: float = 3.
+
+    # later bases take precedence over former ones, and the class over all of them
+    defaults = C.get_defaults()
+    assert (defaults["x"], defaults["y"], defaults["z"]) == (2., 3., 2.)
+    assert list(defaults)[0] == "y"
+    assert C.get_annotations()["x"] is int
+
+
+def test_reassigned_class_options():
+    from cobaya.likelihood import Likelihood
+    from cobaya.model import get_model
+
+    class L(Likelihood):
+        params = {"a": None}
+        noise: float = 0
+
+        def logp(self, **params_values):
+            return 0.
+
+    for noise in [0.5, 0., 0.7]:
+        L.noise = noise
+        assert L.get_defaults()["noise"] == noise
+        model = get_model({"likelihood": {"like": L}, "params": {"a": [0, 1]}})
+        assert model.likelihood["like"].noise == noise
+
+
+def test_merge_info_order():
+    info = merge_info({"params": {"a": [0, 1]}, "sampler": {"mcmc": None}},
+                      {"params": {"b": 1.}, "likelihood": {"one": None}})
+    # same order of blocks as a plain recursive update
+    assert list(info) == ["sampler", "params", "likelihood"]
+    # rightmost params first
+    assert list(info["params"]) == ["b", "a"]
@@ -14,6 +14,7 @@ from cobaya.tools import get_external_function
 from cobaya.likelihood import Likelihood
 from cobaya.model import get_model
 from cobaya.log import LoggedError
+from cobaya.parameterization import expand_info_param
 
 x_func = lambda _: _ / 3
 e_func = lambda _: _ + 1
@@ -168,3 +169,19 @@ def test_parameterization_dependencies():
     with pytest.raises(LoggedError) as e:
         get_model(test_info)
     assert "that are output derived parameters" in str(e.value)
+
+
+def test_expand_info_param():
+    assert expand_info_param([0, 1]) == {"prior": [0, 1]}
+    assert expand_info_param(None, default_derived=False) == {"derived": False}
+    # types of values are kept (not mixed up by caching)
+    assert isinstance(expand_info_param(1)["value"], int)
+    assert isinstance(expand_info_param(1.)["value"], float)
+    assert expand_info_param(True)["value"] is True
+    # results can be modified without affecting later calls
+    expanded = expand_info_param({"prior": {"min": 0, "max": 1}, "ref": [0.4, 0.6]})
+    expanded["prior"]["min"] = 2
+    expanded["ref"].append(0)
+    assert expand_info_param({"prior": {"min": 0, "max": 1}, "ref": [0.4, 0.6]}) == \
+           {"prior": {"min": 0, "max": 1}, "ref": [0.4, 0.6]}
+    assert expand_info_param({"value": x_func})["value"] is x_func